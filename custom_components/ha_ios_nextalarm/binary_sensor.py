@@ -9,33 +9,12 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-try:  # Home Assistant 2023.12+
-    from homeassistant.util import slugify
-except ImportError:  # pragma: no cover - fallback for older Home Assistant
-    from homeassistant.util.slugify import slugify
 
 from .const import DOMAIN
 from .coordinator import NextAlarmCoordinator
-
-DEVICE_MANUFACTURER = "Home Assistant Companion"
-
-
-def _device_identifier(coordinator: NextAlarmCoordinator, slug: str) -> tuple[str, str]:
-    """Return the identifier tuple for a person's device entry."""
-
-    return (DOMAIN, f"{coordinator.entry.entry_id}_{slug}")
-
-
-def _device_name(coordinator: NextAlarmCoordinator, slug: str) -> str:
-    """Return the friendly name for a person's device."""
-
-    state = coordinator.get_person_state(slug)
-    if state and state.person:
-        return state.person
-    return slugify(slug)
+from .entity import async_update_device_registry, device_name, person_device_info
 
 
 async def async_setup_entry(
@@ -71,10 +50,10 @@ class NextAlarmRefreshProblemBinarySensor(BinarySensorEntity):
         self._coordinator = coordinator
         self._slug = slug
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{slug}_refresh_problem"
+        self._last_device_name: str | None = None
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        _async_update_device_registry(self.hass, self._coordinator, self._slug)
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass, self._coordinator.signal_person(self._slug), self._handle_update
@@ -84,7 +63,10 @@ class NextAlarmRefreshProblemBinarySensor(BinarySensorEntity):
 
     @callback
     def _handle_update(self) -> None:
-        _async_update_device_registry(self.hass, self._coordinator, self._slug)
+        name = device_name(self._coordinator, self._slug)
+        if name != self._last_device_name:
+            self._last_device_name = name
+            async_update_device_registry(self.hass, self._coordinator, self._slug)
         self.async_write_ha_state()
 
     @property
@@ -115,27 +97,5 @@ class NextAlarmRefreshProblemBinarySensor(BinarySensorEntity):
 
     @property
     def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={_device_identifier(self._coordinator, self._slug)},
-            manufacturer=DEVICE_MANUFACTURER,
-            name=_device_name(self._coordinator, self._slug),
-        )
+        return person_device_info(self._coordinator, self._slug)
 
-
-def _async_update_device_registry(
-    hass: HomeAssistant | None, coordinator: NextAlarmCoordinator, slug: str
-) -> None:
-    """Ensure a device exists for the person and update its metadata."""
-
-    if hass is None:
-        return
-    name = _device_name(coordinator, slug)
-    registry = dr.async_get(hass)
-    device = registry.async_get_or_create(
-        config_entry_id=coordinator.entry.entry_id,
-        identifiers={_device_identifier(coordinator, slug)},
-        manufacturer=DEVICE_MANUFACTURER,
-        name=name,
-    )
-    if device.name != name:
-        registry.async_update_device(device.id, name=name)
@@ -18,6 +18,7 @@ from .const import (
     DEFAULT_OPTIONS,
     DOMAIN,
     OPTION_WEEKDAY_LOCALES,
+    copy_default_options,
 )
 from . import helpers
 
@@ -46,7 +47,7 @@ class NextAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(
                 title="HA iOS NextAlarm",
                 data={},
-                options=dict(DEFAULT_OPTIONS),
+                options=copy_default_options(),
             )
 
         # Present an explicit empty schema so the UI renders a confirmation form without validation errors.
@@ -104,7 +105,7 @@ class NextAlarmOptionsFlow(config_entries.OptionsFlow):
         errors: dict[str, str] = {}
 
         # Safely get current options
-        current = dict(DEFAULT_OPTIONS)
+        current = copy_default_options()
         try:
             options = self.config_entry.options
             if isinstance(options, dict):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Final
+from typing import Any, Final
 
 from homeassistant.const import Platform
 
@@ -13,6 +13,7 @@ EVENT_REFRESH_START: Final = "ha_ios_nextalarm_refresh_start"
 
 STORAGE_VERSION: Final = 1
 STORAGE_KEY: Final = DOMAIN
+STORAGE_SAVE_DELAY: Final = 1.0
 
 SIGNAL_PERSON_UPDATED: Final = f"{DOMAIN}_person_updated"
 
@@ -28,6 +29,13 @@ DEFAULT_OPTIONS: Final = {
     CONF_REFRESH_TIMEOUT: 5,
 }
 
+
+def copy_default_options() -> dict[str, Any]:
+    """Return a mutable copy of the default options."""
+
+    return DEFAULT_OPTIONS.copy()
+
+
 MAP_VERSION: Final = 1
 
 STR_ONOFF: Final = {"on": True, "off": False}
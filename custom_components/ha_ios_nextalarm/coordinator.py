@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, tzinfo  # Import tzinfo for explicit return typing.
+from functools import partial
 import logging
 import uuid
 from typing import Any
@@ -31,8 +32,10 @@ from .const import (
     MAP_VERSION,
     SIGNAL_PERSON_UPDATED,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
     STR_ONOFF,
+    copy_default_options,
 )
 from . import helpers
 
@@ -311,15 +314,80 @@ class PersonState:
     refresh_problem: bool = False
     refresh_timer_cancel: CALLBACK_TYPE | None = None
     refresh_timeout_token: str | None = None
+    _stored_alarms: tuple[dict[str, helpers.NormalizedAlarm], dict[str, Any]] | None = (
+        field(default=None, init=False, repr=False, compare=False)
+    )
+    _preview: tuple[
+        dict[str, helpers.NormalizedAlarm],
+        dict[str, datetime | None],
+        list[dict[str, Any]],
+    ] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def normalized_preview(self) -> list[dict[str, Any]]:
+        """Return the diagnostics preview, rebuilt only when alarms or schedule change."""
+
+        cached = self._preview
+        if (
+            cached is not None
+            and cached[0] is self.normalized_alarms
+            and cached[1] is self.schedule
+        ):
+            return cached[2]
+        preview = helpers.build_normalized_preview(self.normalized_alarms, self.schedule)
+        self._preview = (self.normalized_alarms, self.schedule, preview)
+        return preview
+
+    @property
+    def next_alarm_display(self) -> helpers.DisplayTime | None:
+        """Return formatted strings for the next alarm time."""
+
+        return helpers.display_time(self.next_alarm_time)
+
+    @property
+    def previous_alarm_display(self) -> helpers.DisplayTime | None:
+        """Return formatted strings for the previous alarm time."""
+
+        return helpers.display_time(self.previous_alarm_time)
+
+    @property
+    def last_event_display(self) -> helpers.DisplayTime | None:
+        """Return formatted strings for the last event time."""
+
+        return helpers.display_time(self.last_event_time)
+
+    @property
+    def last_refresh_start_display(self) -> helpers.DisplayTime | None:
+        """Return formatted strings for the last refresh start."""
+
+        return helpers.display_time(self.last_refresh_start)
+
+    @property
+    def last_refresh_end_display(self) -> helpers.DisplayTime | None:
+        """Return formatted strings for the last refresh end."""
+
+        return helpers.display_time(self.last_refresh_end)
+
+    def _serialized_alarms(self) -> dict[str, Any]:
+        """Return the storage form of the alarms, reusing it while unchanged."""
+
+        # normalized_alarms is always replaced wholesale, never mutated in place,
+        # so an identity check is enough to detect changes between saves.
+        cached = self._stored_alarms
+        if cached is not None and cached[0] is self.normalized_alarms:
+            return cached[1]
+        serialized = {
+            key: alarm.to_dict() for key, alarm in self.normalized_alarms.items()
+        }
+        self._stored_alarms = (self.normalized_alarms, serialized)
+        return serialized
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dictionary representation safe for storage."""
 
         return {
             "person": self.person,
-            "normalized_alarms": {
-                key: alarm.to_dict() for key, alarm in self.normalized_alarms.items()
-            },
+            "normalized_alarms": self._serialized_alarms(),
             "parse_errors": list(self.parse_errors),
             "map_errors": list(self.map_errors),
             "map_locale": self.map_locale,
@@ -560,10 +628,15 @@ class NextAlarmCoordinator:
         self.entry = entry
         self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
         self._person_states: dict[str, PersonState] = {}
-        self._person_listeners: list[Callable[[str], None]] = []
+        self._person_listeners: dict[int, Callable[[str], None]] = {}
+        self._next_listener_token = 0
         self._remove_listener: CALLBACK_TYPE | None = None
         self._remove_refresh_listener: CALLBACK_TYPE | None = None
         self._lock = asyncio.Lock()
+        self._timezone_cache: tuple[str | None, tzinfo] | None = None
+        self._weekday_maps_cache: tuple[
+            str, dict[str, dict[str, int]], list[str]
+        ] | None = None
 
     @property
     def persons(self) -> list[str]:
@@ -621,12 +694,14 @@ class NextAlarmCoordinator:
     def async_add_person_listener(self, listener: Callable[[str], None]) -> Callable[[], None]:
         """Register a callback for new persons."""
 
-        self._person_listeners.append(listener)
+        token = self._next_listener_token
+        self._next_listener_token += 1
+        self._person_listeners[token] = listener
         for slug in self._person_states:
             listener(slug)
 
         def _remove() -> None:
-            self._person_listeners.remove(listener)
+            self._person_listeners.pop(token, None)
 
         return _remove
 
@@ -694,16 +769,32 @@ class NextAlarmCoordinator:
         """Return the active timezone, falling back to UTC when unset."""
 
         tz_name = self.hass.config.time_zone
-        timezone = dt_util.get_time_zone(tz_name) if tz_name else None
-        return timezone or dt_util.UTC
+        cached = self._timezone_cache
+        if cached is not None and cached[0] == tz_name:
+            return cached[1]
+        timezone = (dt_util.get_time_zone(tz_name) if tz_name else None) or dt_util.UTC
+        self._timezone_cache = (tz_name, timezone)
+        return timezone
 
     def _current_options(self) -> dict[str, Any]:
-        options = dict(DEFAULT_OPTIONS)
+        options = copy_default_options()
         entry_options = self.entry.options
         if isinstance(entry_options, dict):
             options.update(entry_options)
         return options
 
+    def _weekday_maps(
+        self, custom_map_json: str
+    ) -> tuple[dict[str, dict[str, int]], list[str]]:
+        """Return weekday maps, rebuilding them only when the custom map changes."""
+
+        cached = self._weekday_maps_cache
+        if cached is None or cached[0] != custom_map_json:
+            maps, map_errors = helpers.build_weekday_maps(custom_map_json)
+            cached = (custom_map_json, maps, map_errors)
+            self._weekday_maps_cache = cached
+        return cached[1], cached[2]
+
     def _refresh_timeout_seconds(self) -> int:
         options = self._current_options()
         raw_timeout = options.get(CONF_REFRESH_TIMEOUT, DEFAULT_OPTIONS[CONF_REFRESH_TIMEOUT])
@@ -753,7 +844,7 @@ class NextAlarmCoordinator:
         state.person = person
 
         options = self._current_options()
-        maps, map_errors = helpers.build_weekday_maps(
+        maps, map_errors = self._weekday_maps(
             options.get(CONF_WEEKDAY_CUSTOM_MAP, DEFAULT_OPTIONS[CONF_WEEKDAY_CUSTOM_MAP])
         )
         if map_errors:
@@ -803,7 +894,7 @@ class NextAlarmCoordinator:
         )
 
         self._schedule_rollover(state)
-        await self._async_save_storage()
+        self._schedule_save_storage()
         _LOGGER.debug(
             "Processed NextAlarm event for %s; next alarm %s",
             state.person,
@@ -842,12 +933,14 @@ class NextAlarmCoordinator:
         )
         self._schedule_refresh_timeout(state, token)
 
-        await self._async_save_storage()
+        self._schedule_save_storage()
         _LOGGER.debug("Processed refresh start event for %s", state.person)
         self._notify_person_update(slug)
 
     def _notify_new_person(self, slug: str) -> None:
-        for listener in list(self._person_listeners):
+        if not self._person_listeners:
+            return
+        for listener in list(self._person_listeners.values()):
             listener(slug)
 
     def _notify_person_update(self, slug: str) -> None:
@@ -878,7 +971,7 @@ class NextAlarmCoordinator:
             state.previous_alarm_key = state.next_alarm_key
         self._refresh_schedule(state, reference_time=trigger_time)
         self._schedule_rollover(state)
-        await self._async_save_storage()
+        self._schedule_save_storage()
         _LOGGER.debug("Rollover executed for %s", state.person)
         self._notify_person_update(slug)
 
@@ -902,7 +995,7 @@ class NextAlarmCoordinator:
     def build_preview(self, state: PersonState) -> list[dict[str, Any]]:
         """Expose helper for diagnostics sensor."""
 
-        return helpers.build_normalized_preview(state.normalized_alarms, state.schedule)
+        return state.normalized_preview
 
     def describe_time_until(self, state: PersonState) -> str | None:
         """Return a human-friendly delta for the next alarm."""
@@ -925,17 +1018,15 @@ class NextAlarmCoordinator:
             token,
         )
 
-        @callback
-        def _fire(*_args) -> None:
-            # The token check in _async_mark_refresh_timeout prevents stale timers
-            # from marking a newer refresh as failed, even if cancellation races.
-            self.hass.async_create_task(
-                self._async_mark_refresh_timeout(
-                    state.slug, dt_util.utcnow(), token
-                )
-            )
+        state.refresh_timer_cancel = async_call_later(
+            self.hass, timeout, partial(self._fire_refresh_timeout, state.slug, token)
+        )
 
-        state.refresh_timer_cancel = async_call_later(self.hass, timeout, _fire)
+    @callback
+    def _fire_refresh_timeout(self, slug: str, token: str, now: datetime) -> None:
+        # The token check in _async_mark_refresh_timeout prevents stale timers
+        # from marking a newer refresh as failed, even if cancellation races.
+        self.hass.async_create_task(self._async_mark_refresh_timeout(slug, now, token))
 
     def _cancel_refresh_timer(self, state: PersonState) -> None:
         if state.refresh_timer_cancel:
@@ -969,7 +1060,7 @@ class NextAlarmCoordinator:
         state.refresh_timer_cancel = None
         state.refresh_problem = True
         state.refresh_timeout_token = None
-        await self._async_save_storage()
+        self._schedule_save_storage()
 
         _LOGGER.debug(
             "Refresh problem set: person=%s, slug=%s",
@@ -1013,6 +1104,12 @@ class NextAlarmCoordinator:
         )
         return resolved
 
+    @callback
+    def _schedule_save_storage(self) -> None:
+        """Coalesce bursts of state changes into a single storage write."""
+
+        self._store.async_delay_save(self._storage_payload, STORAGE_SAVE_DELAY)
+
     async def _async_save_storage(self) -> None:
         try:
             await self._store.async_save(self._storage_payload())
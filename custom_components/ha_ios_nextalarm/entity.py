@@ -0,0 +1,179 @@
+"""Device helpers and base entity shared by the HA iOS NextAlarm platforms."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+try:  # Home Assistant 2023.12+
+    from homeassistant.util import slugify
+except ImportError:  # pragma: no cover - fallback for older Home Assistant
+    from homeassistant.util.slugify import slugify
+
+from .const import DOMAIN
+from .coordinator import NextAlarmCoordinator, PersonState
+from .helpers import describe_time_until
+
+DEVICE_MANUFACTURER = "Home Assistant Companion"
+
+
+def device_identifier(coordinator: NextAlarmCoordinator, slug: str) -> tuple[str, str]:
+    """Return the identifier tuple for a person's device entry."""
+
+    return (DOMAIN, f"{coordinator.entry.entry_id}_{slug}")
+
+
+def device_name(coordinator: NextAlarmCoordinator, slug: str) -> str:
+    """Return the friendly name for a person's device."""
+
+    state = coordinator.get_person_state(slug)
+    if state and state.person:
+        return state.person
+    return slugify(slug)
+
+
+def person_device_info(coordinator: NextAlarmCoordinator, slug: str) -> DeviceInfo:
+    """Return the device info shared by a person's entities."""
+
+    return DeviceInfo(
+        identifiers={device_identifier(coordinator, slug)},
+        manufacturer=DEVICE_MANUFACTURER,
+        name=device_name(coordinator, slug),
+    )
+
+
+def async_update_device_registry(
+    hass: HomeAssistant | None, coordinator: NextAlarmCoordinator, slug: str
+) -> None:
+    """Ensure a device exists for the person and update its metadata."""
+
+    if hass is None:
+        return
+    name = device_name(coordinator, slug)
+    registry = dr.async_get(hass)
+    device = registry.async_get_or_create(
+        config_entry_id=coordinator.entry.entry_id,
+        identifiers={device_identifier(coordinator, slug)},
+        manufacturer=DEVICE_MANUFACTURER,
+        name=name,
+    )
+    if device.name != name:
+        registry.async_update_device(device.id, name=name)
+
+
+def _state_fingerprint(state: PersonState | None) -> tuple[Any, ...]:
+    """Return a cheap summary of the fields exposed by the sensors.
+
+    Containers are included by reference. The coordinator replaces them rather
+    than mutating them, and tuple equality checks identity before contents, so
+    an unchanged state compares cheaply.
+    """
+
+    if state is None:
+        return ()
+    return (
+        state.person,
+        state.map_version,
+        state.map_locale,
+        state.note,
+        state.next_alarm_key,
+        state.next_alarm_time,
+        state.previous_alarm_key,
+        state.previous_alarm_time,
+        state.last_event_time,
+        state.last_refresh_start,
+        state.last_refresh_end,
+        state.refresh_problem,
+        state.normalized_alarms,
+        state.schedule,
+        state.parse_errors,
+        state.map_errors,
+        state.raw_event,
+    )
+
+
+class NextAlarmPersonEntity(Entity):
+    """Base for the per-person sensors fed by coordinator dispatcher signals."""
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+
+    _unique_id_suffix: str
+    # Only one entity per device updates the registry; the others share it.
+    _syncs_device_registry = False
+    _includes_time_until = False
+
+    def __init__(self, coordinator: NextAlarmCoordinator, slug: str) -> None:
+        self._coordinator = coordinator
+        self._slug = slug
+        self._attr_unique_id = (
+            f"{coordinator.entry.entry_id}_{slug}_{self._unique_id_suffix}"
+        )
+        self._signal = coordinator.signal_person(slug)
+        self._attr_device_info = person_device_info(coordinator, slug)
+        self._last_device_name: str | None = None
+        self._state: PersonState | None = None
+        self._last_fingerprint: tuple[Any, ...] | None = None
+        self._attrs_cache: dict[str, Any] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._signal, self._handle_update
+            )
+        )
+        # The platform writes the initial state right after this hook returns.
+        self._refresh_from_coordinator()
+
+    @callback
+    def _handle_update(self) -> None:
+        if self._refresh_from_coordinator():
+            self.async_write_ha_state()
+
+    @callback
+    def _refresh_from_coordinator(self) -> bool:
+        """Pull the latest person state and report whether it changed."""
+
+        self._state = self._coordinator.get_person_state(self._slug)
+        name = device_name(self._coordinator, self._slug)
+        if name != self._last_device_name:
+            self._last_device_name = name
+            self._attr_device_info = person_device_info(self._coordinator, self._slug)
+            if self._syncs_device_registry:
+                async_update_device_registry(self.hass, self._coordinator, self._slug)
+        fingerprint = _state_fingerprint(self._state)
+        if fingerprint == self._last_fingerprint:
+            return False
+        self._last_fingerprint = fingerprint
+        self._attrs_cache = None
+        return True
+
+    @property
+    def available(self) -> bool:
+        return self._state is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        # Rebuilt only after _handle_update sees a changed person state.
+        if self._attrs_cache is None:
+            self._attrs_cache = self._build_attributes()
+        state = self._state
+        if (
+            not self._includes_time_until
+            or state is None
+            or state.next_alarm_time is None
+        ):
+            return self._attrs_cache
+        # time_until depends on the wall clock, so it is never cached.
+        return {
+            **self._attrs_cache,
+            "time_until": describe_time_until(state.next_alarm_time),
+        }
+
+    def _build_attributes(self) -> dict[str, Any]:
+        raise NotImplementedError
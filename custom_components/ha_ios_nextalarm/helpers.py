@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, time
+from functools import lru_cache
 import json
 import logging
 import unicodedata
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Mapping, Sequence
 
 from homeassistant.util import dt as dt_util
 
@@ -16,7 +17,7 @@ from .const import PREVIEW_LIMIT, STR_ONOFF, WEEKDAY_MAPS
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedAlarm:
     """Representation of a normalized alarm received from an event."""
 
@@ -26,8 +27,16 @@ class NormalizedAlarm:
     repeat: bool
     snooze: bool
     base_time: datetime
-    repeat_days_localized: list[str]
-    repeat_days_normalized: list[int]
+    repeat_days_localized: tuple[str, ...]
+    repeat_days_normalized: tuple[int, ...]
+    # Set view of repeat_days_normalized for weekday membership checks; the
+    # tuple keeps input order so it stays aligned with repeat_days_localized.
+    repeat_weekdays: frozenset[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "repeat_weekdays", frozenset(self.repeat_days_normalized)
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the alarm into a JSON-friendly dictionary."""
@@ -62,8 +71,8 @@ class NormalizedAlarm:
             repeat=bool(data.get("repeat", False)),
             snooze=bool(data.get("snooze", False)),
             base_time=base_time,
-            repeat_days_localized=list(data.get("repeat_days_localized", [])),
-            repeat_days_normalized=list(data.get("repeat_days_normalized", [])),
+            repeat_days_localized=tuple(data.get("repeat_days_localized", [])),
+            repeat_days_normalized=tuple(data.get("repeat_days_normalized", [])),
         )
 
 
@@ -87,6 +96,38 @@ class NextAlarmComputation:
     note: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class DisplayTime:
+    """Preformatted UTC and local representations of a datetime."""
+
+    iso: str
+    local_iso: str
+    local_date: str
+    local_clock: str
+
+
+@lru_cache(maxsize=64)
+def _build_display_time(value: datetime, value_tzinfo, time_zone) -> DisplayTime:
+    # value_tzinfo is part of the key because equal instants in different zones
+    # hash alike but format with different offsets.
+    localized = value.astimezone(time_zone)
+    return DisplayTime(
+        iso=value.isoformat(),
+        local_iso=localized.isoformat(),
+        local_date=localized.date().isoformat(),
+        local_clock=localized.strftime("%H:%M:%S"),
+    )
+
+
+def display_time(value: datetime | None) -> DisplayTime | None:
+    """Return cached display strings for a datetime in the local timezone."""
+
+    if value is None:
+        return None
+    return _build_display_time(value, value.tzinfo, dt_util.DEFAULT_TIME_ZONE)
+
+
+@lru_cache(maxsize=256)
 def normalize_day_key(value: str) -> str:
     """Normalize weekday names for lookup."""
 
@@ -103,14 +144,106 @@ def _localize(naive: datetime, tzinfo) -> datetime:
     return naive.replace(tzinfo=tzinfo)
 
 
+def _make_localizer(tzinfo) -> Callable[[datetime], datetime]:
+    """Return a callable attaching a timezone to naive datetimes."""
+
+    if hasattr(tzinfo, "localize"):
+        return tzinfo.localize
+    return lambda naive: naive.replace(tzinfo=tzinfo)
+
+
+def _parse_iso_fast(text: str) -> datetime | None:
+    """Parse ISO-8601 shaped text directly with ``datetime.fromisoformat``."""
+
+    if len(text) < 19 or text[4] != "-" or text[7] != "-" or text[10] not in "T ":
+        return None
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _parse_eu_fast(text: str) -> datetime | None:
+    """Parse ``DD.MM.YYYY HH:MM`` without going through strptime."""
+
+    if (
+        len(text) != 16
+        or text[2] != "."
+        or text[5] != "."
+        or text[10] != " "
+        or text[13] != ":"
+    ):
+        return None
+    # int() alone would also accept signs, spaces and non-ASCII digits.
+    digits = text[0:2] + text[3:5] + text[6:10] + text[11:13] + text[14:16]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return datetime(
+            int(text[6:10]),
+            int(text[3:5]),
+            int(text[0:2]),
+            int(text[11:13]),
+            int(text[14:16]),
+        )
+    except ValueError:
+        return None
+
+
+def _parse_us_ampm_fast(text: str) -> datetime | None:
+    """Parse ``MM/DD/YYYY HH:MM AM`` without going through strptime."""
+
+    if (
+        len(text) != 19
+        or text[2] != "/"
+        or text[5] != "/"
+        or text[10] != " "
+        or text[13] != ":"
+        or text[16] != " "
+    ):
+        return None
+    # int() alone would also accept signs, spaces and non-ASCII digits.
+    digits = text[0:2] + text[3:5] + text[6:10] + text[11:13] + text[14:16]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    meridiem = text[17:19].upper()
+    if meridiem not in ("AM", "PM"):
+        return None
+    try:
+        hour = int(text[11:13])
+        if hour < 1 or hour > 12:
+            return None
+        hour %= 12
+        if meridiem == "PM":
+            hour += 12
+        return datetime(
+            int(text[6:10]),
+            int(text[0:2]),
+            int(text[3:5]),
+            hour,
+            int(text[14:16]),
+        )
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
 def parse_alarm_datetime(value: str, tzinfo) -> datetime:
-    """Parse the alarm datetime string into an aware datetime."""
+    """Parse the alarm datetime string into an aware datetime.
+
+    Results are memoized because Shortcuts resend the same alarm dates with
+    every event; failures raise and are therefore never cached.
+    """
 
     text = (value or "").strip()
     if not text:
         raise ValueError("missing datetime value")
 
-    parsed = dt_util.parse_datetime(text)
+    parsed = _parse_iso_fast(text)
+    if parsed is None:
+        parsed = dt_util.parse_datetime(text)
+    if parsed is None:
+        parsed = _parse_eu_fast(text) or _parse_us_ampm_fast(text)
     if parsed is None:
         try:
             parsed = datetime.strptime(text, "%d.%m.%Y %H:%M")
@@ -275,7 +408,7 @@ def normalize_event(
     normalized_alarms: dict[str, NormalizedAlarm] = {}
     all_repeat_lines: list[str] = []
 
-    valid_alarms: dict[str, Mapping[str, Any]] = {}
+    items: list[tuple[str, Mapping[str, Any]]] = []
     for key, raw_alarm in alarms.items():
         str_key = str(key)
         if not isinstance(raw_alarm, Mapping):
@@ -283,7 +416,7 @@ def normalize_event(
                 f"Alarm {str_key}: payload must be an object with alarm fields"
             )
             continue
-        valid_alarms[str_key] = raw_alarm
+        items.append((str_key, raw_alarm))
         raw_days = raw_alarm.get("Repeat Days")
         if isinstance(raw_days, str):
             all_repeat_lines.extend(
@@ -292,7 +425,7 @@ def normalize_event(
 
     map_locale = detect_weekday_locale(all_repeat_lines, locale_option, maps)
 
-    for key, raw_alarm in valid_alarms.items():
+    for key, raw_alarm in items:
         label = str(raw_alarm.get("Label", "")).strip() or key
         raw_date = raw_alarm.get("Date")
         if raw_date is None:
@@ -347,8 +480,8 @@ def normalize_event(
             repeat=repeat,
             snooze=snooze,
             base_time=base_time,
-            repeat_days_localized=repeat_days_localized,
-            repeat_days_normalized=repeat_days_normalized,
+            repeat_days_localized=tuple(repeat_days_localized),
+            repeat_days_normalized=tuple(repeat_days_normalized),
         )
 
     return NormalizedEvent(
@@ -394,13 +527,14 @@ def compute_single_alarm_next(
         microsecond=base_local.microsecond,
     )
 
+    localize = _make_localizer(tzinfo)
     for offset in range(0, 8):
         candidate_date = local_today + timedelta(days=offset)
         weekday = candidate_date.weekday()
-        if weekday not in alarm.repeat_days_normalized:
+        if weekday not in alarm.repeat_weekdays:
             continue
         candidate_naive = datetime.combine(candidate_date, base_time_components)
-        candidate = _localize(candidate_naive, tzinfo)
+        candidate = localize(candidate_naive)
         if candidate > now:
             return candidate
     return None